@@ -3,7 +3,7 @@ from src.ui import create_and_bind_chart, create_dual_chart_grid
 from src.config import config
 
 
-if __name__ == "__main__":
+def main():
     path = config.general.data_path
     filename = config.general.data_filename
     dict_filename = f"{path}/{filename}"
@@ -20,3 +20,7 @@ if __name__ == "__main__":
         chart = create_and_bind_chart(chart_data)
 
     chart.show(block=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 import pandas as pd
+import pyarrow as pa
+from pyarrow import feather
 from datetime import datetime, timedelta
 import numpy as np
 from pandera import check_output
@@ -25,10 +27,14 @@ def load_daily_data(ticker: str, date: datetime, data: pd.DataFrame) -> pd.DataF
 
     n_days = timedelta(days=N_DAYS)
 
+    # Filter on the raw column buffers; plain ndarray comparisons skip the
+    # per-Series index-alignment machinery on this hot path.
+    tickers = data["ticker"].to_numpy()
+    dates = data["date"].to_numpy()
     conditions = [
-        (data["ticker"] == ticker),
-        (data["date"] >= date - n_days),
-        (data["date"] <= date + n_days),
+        (tickers == ticker),
+        (dates >= np.datetime64(date - n_days)),
+        (dates <= np.datetime64(date + n_days)),
     ]
 
     # Merge or process as needed, here we just return the data
@@ -57,32 +63,49 @@ def load_daily_df(dict_filename: str) -> pd.DataFrame:
 
 def apply_indicators(df: pd.DataFrame) -> pd.DataFrame:
     indicators_list = config.indicators if config.indicators is not None else []
+    if not indicators_list:
+        return df  # nothing to compute, avoid the groupby setup
     df_grouped = df.groupby("ticker", observed=True)
     for indicator in indicators_list:
         if indicator.name == "SMA":
             if indicator.parameters is not None and "period" in indicator.parameters:
                 period = indicator.parameters["period"]
                 col_name = f"SMA_{period}"
-                df[col_name] = df_grouped["close"].transform(
-                    lambda x: x.rolling(window=period).mean()
-                )
+                # Grouped rolling runs in a single cythonized kernel instead
+                # of calling a Python lambda once per ticker.
+                sma = df_grouped["close"].rolling(window=period).mean()
+                df[col_name] = sma.droplevel(0)
 
     return df
 
 
 @check_output(min_schema)
-def load_min_data(data_filename: str) -> pd.DataFrame:
+def load_min_data(data_filename: str, needs_date: bool = False) -> pd.DataFrame:
     """
     Reads and validates minute data from a Feather file.
     Args:
         data_filename (str): Path to the Feather file.
+        needs_date (bool): Whether to include the derived '_date' bucket
+            column. The intraday chart path drops it again, so it is
+            skipped by default.
     Returns:
         pd.DataFrame: Validated DataFrame with 'datetime' as index.
     """
-    df = pd.read_feather(data_filename)
-    df["datetime_u"] = df["datetime"].dt.tz_localize(None)
-    df.drop(columns=["datetime"], inplace=True)
-    df.rename(columns={"datetime_u": "datetime", "date": "_date"}, inplace=True)
+    table = feather.read_table(data_filename)
+    dt_col = table["datetime"]
+    if dt_col.type.tz is not None:
+        # Dropping the zone is a metadata-only cast in Arrow: the stored
+        # int64 instants are unchanged, so no pass over the data is needed.
+        idx = table.schema.get_field_index("datetime")
+        table = table.set_column(idx, "datetime", dt_col.cast(pa.timestamp("ns")))
+        # The embedded pandas metadata would re-apply the original tz dtype
+        # in to_pandas(), so drop it once the column has been re-typed.
+        table = table.replace_schema_metadata(None)
+    df = table.to_pandas()
+    if needs_date:
+        # _date is only a calendar-day bucket; truncating through datetime64[D]
+        # drops the intraday part and stores it at coarser-than-ns resolution.
+        df["_date"] = df["datetime"].values.astype("datetime64[D]")
     df.sort_values(by=["ticker", "datetime"], inplace=True)
     df.reset_index(drop=True, inplace=True)
     return df
@@ -103,10 +126,12 @@ def load_min_chart(ticker: str, date, data: pd.DataFrame, n_days=None) -> pd.Dat
     n_days = n_days if n_days is not None else config.chart.n_days_intraday
     n_days = pd.Timedelta(days=n_days)
 
+    tickers = data["ticker"].to_numpy()
+    datetimes = data["datetime"].to_numpy()
     conditions = [
-        (data["ticker"] == ticker),
-        (data["datetime"] >= date - n_days),
-        (data["datetime"] <= date + n_days),
+        (tickers == ticker),
+        (datetimes >= np.datetime64(date - n_days)),
+        (datetimes <= np.datetime64(date + n_days)),
     ]
 
     # Merge or process as needed, here we just return the data
@@ -126,7 +151,12 @@ def format_min_chart_data(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Formatted DataFrame with 'time' as string and 'datetime' as index.
     """
-    df["time"] = df["datetime"].dt.strftime("%Y-%m-%d %H:%M:%S")
+    # Arrow-backed strings: one contiguous buffer instead of per-row PyObjects,
+    # which is what the chart serialization ends up iterating over.
+    df["time"] = pd.array(
+        df["datetime"].dt.strftime("%Y-%m-%d %H:%M:%S"),
+        dtype=pd.ArrowDtype(pa.string()),
+    )
     columns_to_drop = ["datetime"]
     if "_date" in df.columns:
         columns_to_drop.append("_date")
@@ -1,6 +1,7 @@
 from abc import ABC
 import pandas as pd
-from typing import Union, Optional
+from datetime import datetime
+from typing import NamedTuple, Optional, Union
 from .data import (
     load_daily_data,
     load_daily_df,
@@ -38,11 +39,34 @@ class ChartsWMOverride(Chart):
         )
 
 
+class ChartMeta(NamedTuple):
+    """
+    Metadata describing the chart at a given index. A NamedTuple keeps
+    equality checks and per-instance memory cheaper than a dict.
+    """
+
+    ticker: str
+    date_str: str
+    date: Optional[datetime] = None
+    timeframe: str = "1D"
+    index: int = 0
+
+
 class ChartsData(ABC):
     def __init__(self, charts):
         self.charts = charts
         self.current_index = 0
 
+    @classmethod
+    def _from_parts(cls, charts, data=None, current_index=0):
+        """
+        Builds an instance directly from already-loaded parts, bypassing
+        __init__ (and therefore any file loading in subclasses).
+        """
+        obj = cls.__new__(cls)
+        obj.__dict__.update(charts=charts, data=data, current_index=current_index)
+        return obj
+
     def set_index(self, index):
         self.current_index = index
 
@@ -70,7 +94,7 @@ class ChartsData(ABC):
     def load_chart(self, index: Optional[int] = None):
         raise NotImplementedError("This method should be implemented by subclasses.")
 
-    def get_metadata(self, index: int) -> dict:
+    def get_metadata(self, index: int) -> ChartMeta:
         raise NotImplementedError("This method should be implemented by subclasses.")
 
 
@@ -91,25 +115,25 @@ class ChartsDailyData(ChartsData):
         self.data = load_daily_df(self.data_filename)
         self.data = apply_indicators(self.data)
 
-    def get_metadata(self, index: int) -> dict:
+    def get_metadata(self, index: int) -> ChartMeta:
         ticker = self.charts.ticker.iloc[index]
         date = self.charts.date.iloc[index]
-        return {
-            "ticker": ticker,
-            "date_str": date.strftime("%Y-%m-%d"),
-            "date": date,
-            "timeframe": "1D",
-            "index": index,
-        }
-
-    def load_chart(self, index: Optional[int] = None) -> tuple[pd.DataFrame, dict]:
+        return ChartMeta(
+            ticker=ticker,
+            date_str=date.strftime("%Y-%m-%d"),
+            date=date,
+            timeframe="1D",
+            index=index,
+        )
+
+    def load_chart(self, index: Optional[int] = None) -> tuple[pd.DataFrame, ChartMeta]:
         if index is None:
             index = self.current_index
 
         metadata = self.get_metadata(index)
 
-        ticker = metadata["ticker"]
-        date = metadata["date"]
+        ticker = metadata.ticker
+        date = metadata.date
         df = load_daily_data(ticker, date, self.data)
         return df, metadata
 
@@ -137,24 +161,24 @@ class ChartsMinuteData(ChartsData):
         """Set the current timeframe for display purposes."""
         self.current_timeframe = timeframe
 
-    def get_metadata(self, index: int) -> dict:
+    def get_metadata(self, index: int) -> ChartMeta:
         ticker = self.charts.ticker.iloc[index]
         date = self.charts.date.iloc[index]
-        return {
-            "ticker": ticker,
-            "date_str": date.strftime("%Y-%m-%d"),
-            "date": date,
-            "timeframe": self.current_timeframe,
-            "index": index,
-        }
-
-    def load_chart(self, index: Optional[int] = None) -> tuple[pd.DataFrame, dict]:
+        return ChartMeta(
+            ticker=ticker,
+            date_str=date.strftime("%Y-%m-%d"),
+            date=date,
+            timeframe=self.current_timeframe,
+            index=index,
+        )
+
+    def load_chart(self, index: Optional[int] = None) -> tuple[pd.DataFrame, ChartMeta]:
         if index is None:
             index = self.current_index
 
         metadata = self.get_metadata(index)
 
-        ticker = metadata["ticker"]
-        date = metadata["date"]
+        ticker = metadata.ticker
+        date = metadata.date
         df = load_min_chart(ticker, date, self.data)
         return df, metadata
@@ -1,4 +1,6 @@
 from pandera import Column, DataFrameSchema, Check
+import pandas as pd
+import pyarrow as pa
 from numpy import datetime64, float32
 from typing import Union
 from numpy import int32
@@ -25,7 +27,7 @@ min_schema = DataFrameSchema(
         "low": Column(float32, Check.greater_than_or_equal_to(0.0), nullable=False),
         "close": Column(float32, Check.greater_than_or_equal_to(0.0), nullable=False),
         "volume": Column(int32, Check.greater_than_or_equal_to(0), nullable=False),
-        "_date": Column(datetime64, nullable=False),
+        "_date": Column(datetime64, nullable=False, required=False),
     },
     strict="filter",
 )
@@ -33,7 +35,7 @@ min_schema = DataFrameSchema(
 min_chart_schema = DataFrameSchema(
     {
         "ticker": Column(str, nullable=False),
-        "time": Column(str, nullable=False),
+        "time": Column(pd.ArrowDtype(pa.string()), nullable=False),
         "open": Column(float32, Check.greater_than_or_equal_to(0.0), nullable=False),
         "high": Column(float32, Check.greater_than_or_equal_to(0.0), nullable=False),
         "low": Column(float32, Check.greater_than_or_equal_to(0.0), nullable=False),
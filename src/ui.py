@@ -30,14 +30,14 @@ def plot_chart(df: pd.DataFrame, metadata: dict, chart: Chart) -> None:
     try:
         # Try to use custom watermark with vert_align (for ChartsWMOverride)
         chart.watermark(
-            f"{metadata['ticker']} {metadata['timeframe']} {metadata['date_str']}",
+            f"{metadata.ticker} {metadata.timeframe} {metadata.date_str}",
             vert_align="top",
         )
     except (AttributeError, TypeError):
         # Fallback to standard watermark (for regular Chart or subcharts)
         try:
             chart.watermark(
-                f"{metadata['ticker']} {metadata['timeframe']} {metadata['date_str']}",
+                f"{metadata.ticker} {metadata.timeframe} {metadata.date_str}",
             )
         except:
             chart.watermark("na")
@@ -62,7 +62,7 @@ def save_screenshot(chart: Chart, chart_data: ChartsData, folder="screenshots")
 
     img = chart.screenshot()
     metadata = chart_data.get_metadata(chart_data.current_index)
-    filename = f"{folder}/{metadata['ticker']}_{metadata['date_str']}_screenshot.png"
+    filename = f"{folder}/{metadata.ticker}_{metadata.date_str}_screenshot.png"
     with open(filename, "wb") as f:
         f.write(img)
     print(f"Screenshot saved to {filename}")
@@ -150,7 +150,7 @@ def on_timeframe_change(chart, chart_data, timeframe):
     # Reload current chart with new timeframe
     df, metadata = chart_data.load_chart(chart_data.current_index)
     if not hasattr(chart_data, "set_timeframe"):
-        metadata["timeframe"] = timeframe
+        metadata = metadata._replace(timeframe=timeframe)
     plot_chart(df, metadata, chart)
 
 
@@ -180,7 +180,7 @@ def save_screenshot_dual(
     img1 = chart1.screenshot()
     metadata1 = chart_data1.get_metadata(chart_data1.current_index)
     filename1 = (
-        f"{folder}/{metadata1['ticker']}_{metadata1['date_str']}_chart1_screenshot.png"
+        f"{folder}/{metadata1.ticker}_{metadata1.date_str}_chart1_screenshot.png"
     )
     with open(filename1, "wb") as f:
         f.write(img1)
@@ -189,7 +189,7 @@ def save_screenshot_dual(
     img2 = chart2.screenshot()
     metadata2 = chart_data2.get_metadata(chart_data2.current_index)
     filename2 = (
-        f"{folder}/{metadata2['ticker']}_{metadata2['date_str']}_chart2_screenshot.png"
+        f"{folder}/{metadata2.ticker}_{metadata2.date_str}_chart2_screenshot.png"
     )
     with open(filename2, "wb") as f:
         f.write(img2)
@@ -5,9 +5,11 @@ import pytest
 import pandas as pd
 import tempfile
 import json
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock
 
+from src.models import ChartMeta, ChartsDailyData
 from tests.fixtures.sample_data import (
     create_sample_stock_data,
     create_sample_config_data,
@@ -133,51 +135,35 @@ def mock_chart():
 @pytest.fixture
 def mock_chart_data():
     """Fixture providing a mock chart data object."""
-    chart_data = Mock()
+    # spec keeps the mock's attribute graph bounded to the real interface
+    # instead of lazily materializing a child mock per attribute access.
+    chart_data = Mock(spec=ChartsDailyData)
     chart_data.current_index = 0
     chart_data.charts = create_sample_charts_data()
     chart_data.data = create_sample_stock_data()
     
     # Mock methods
-    chart_data.get_metadata = Mock(return_value={
-        'ticker': 'AAPL',
-        'date_str': '2023-01-15',
-        'date': pd.Timestamp('2023-01-15'),
-        'timeframe': '1D',
-        'index': 0
-    })
+    chart_data.get_metadata = Mock(return_value=ChartMeta(
+        ticker='AAPL', date_str='2023-01-15', date=pd.Timestamp('2023-01-15'),
+        timeframe='1D', index=0
+    ))
     
     chart_data.load_chart = Mock(return_value=(
         create_sample_stock_data(periods=30),
-        {
-            'ticker': 'AAPL',
-            'date_str': '2023-01-15',
-            'date': pd.Timestamp('2023-01-15'),
-            'timeframe': '1D',
-            'index': 0
-        }
+        ChartMeta(ticker='AAPL', date_str='2023-01-15',
+                  date=pd.Timestamp('2023-01-15'), timeframe='1D', index=0)
     ))
     
     chart_data.next_chart = Mock(return_value=(
         create_sample_stock_data(periods=30),
-        {
-            'ticker': 'MSFT',
-            'date_str': '2023-01-16',
-            'date': pd.Timestamp('2023-01-16'),
-            'timeframe': '1D',
-            'index': 1
-        }
+        ChartMeta(ticker='MSFT', date_str='2023-01-16',
+                  date=pd.Timestamp('2023-01-16'), timeframe='1D', index=1)
     ))
     
     chart_data.previous_chart = Mock(return_value=(
         create_sample_stock_data(periods=30),
-        {
-            'ticker': 'GOOGL',
-            'date_str': '2023-01-14',
-            'date': pd.Timestamp('2023-01-14'),
-            'timeframe': '1D',
-            'index': 2
-        }
+        ChartMeta(ticker='GOOGL', date_str='2023-01-14',
+                  date=pd.Timestamp('2023-01-14'), timeframe='1D', index=2)
     ))
     
     return chart_data
@@ -207,6 +193,35 @@ def _disable_warnings(disable_warnings):
     pass
 
 
+@pytest.fixture(scope="session")
+def minute_charts_df():
+    """Session-scoped charts dictionary frame for the minute-data tests."""
+    return pd.DataFrame({
+        'ticker': ['AAPL', 'MSFT'],
+        'date': [datetime(2023, 1, 15), datetime(2023, 1, 16)],
+        'volume': [1000, 2000]
+    })
+
+
+@pytest.fixture(scope="session")
+def minute_data_df():
+    """Session-scoped minute data frame for the minute-data tests."""
+    return pd.DataFrame({
+        'ticker': ['AAPL', 'MSFT'],
+        'datetime': [datetime(2023, 1, 15, 9, 30), datetime(2023, 1, 16, 9, 30)],
+        'close': [150.0, 250.0]
+    })
+
+
+@pytest.fixture(scope="session")
+def minute_chart_df():
+    """Session-scoped formatted chart frame for the minute-data tests."""
+    return pd.DataFrame({
+        'time': ['2023-01-16 09:30:00'],
+        'close': [250.0]
+    })
+
+
 @pytest.fixture
 def sample_min_data():
     """Fixture providing sample minute data."""
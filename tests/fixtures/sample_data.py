@@ -30,45 +30,37 @@ def create_sample_stock_data(
         tickers = ["AAPL", "MSFT"]
 
     np.random.seed(seed)
-    dates = pd.date_range(start_date, periods=periods, freq="D")
-
-    data = []
-    for ticker in tickers:
-        # Generate realistic stock prices
-        base_price = np.random.uniform(100, 300)
-        prices = []
-        current_price = base_price
-
-        for _ in range(periods):
-            # Random walk with slight upward bias
-            change = np.random.normal(0.001, 0.02)  # 0.1% daily return, 2% volatility
-            current_price *= 1 + change
-            prices.append(current_price)
-
-        for i, date in enumerate(dates):
-            price = prices[i]
-            # Generate OHLC data
-            high = price * np.random.uniform(1.0, 1.05)
-            low = price * np.random.uniform(0.95, 1.0)
-            open_price = np.random.uniform(low, high)
-            close_price = price
-            volume = np.random.randint(100000, 10000000)
-
-            data.append(
-                {
-                    "ticker": ticker,
-                    "date": date,
-                    "open": np.float32(open_price),
-                    "high": np.float32(high),
-                    "low": np.float32(low),
-                    "close": np.float32(close_price),
-                    "volume": volume,
-                    "adjusted": False,
-                    "type": "CS",
-                }
-            )
-
-    return pd.DataFrame(data)
+    n_rows = len(tickers) * periods
+
+    # Build columns as whole ndarrays (np.tile/np.repeat on the raw
+    # datetime64 buffer) instead of appending per-row dicts of Timestamps.
+    dates = pd.date_range(start_date, periods=periods, freq="D").values
+    date_col = np.tile(dates, len(tickers))
+    ticker_col = np.repeat(np.array(tickers, dtype=object), periods)
+
+    # Random walk with slight upward bias (0.1% daily return, 2% volatility)
+    base_prices = np.random.uniform(100, 300, size=len(tickers))
+    changes = np.random.normal(0.001, 0.02, size=(len(tickers), periods))
+    close = (base_prices[:, None] * np.cumprod(1 + changes, axis=1)).ravel()
+
+    high = close * np.random.uniform(1.0, 1.05, size=n_rows)
+    low = close * np.random.uniform(0.95, 1.0, size=n_rows)
+    open_price = np.random.uniform(low, high)
+    volume = np.random.randint(100000, 10000000, size=n_rows)
+
+    return pd.DataFrame(
+        {
+            "ticker": ticker_col,
+            "date": date_col,
+            "open": open_price.astype(np.float32),
+            "high": high.astype(np.float32),
+            "low": low.astype(np.float32),
+            "close": close.astype(np.float32),
+            "volume": volume,
+            "adjusted": False,
+            "type": "CS",
+        }
+    )
 
 
 def create_sample_config_data() -> Dict[str, Any]:
@@ -188,43 +180,33 @@ def create_sample_min_data(
         tickers = ["AAPL", "MSFT"]
 
     np.random.seed(seed)
-    datetimes = pd.date_range(start_datetime, periods=periods, freq=freq)
-
-    data = []
-    for ticker in tickers:
-        # Generate realistic stock prices
-        base_price = np.random.uniform(100, 300)
-        prices = []
-        current_price = base_price
-
-        for _ in range(periods):
-            # Random walk with smaller changes for minute data
-            change = np.random.normal(0.0001, 0.005)  # Smaller volatility for minute data
-            current_price *= 1 + change
-            prices.append(current_price)
-
-        for i, dt in enumerate(datetimes):
-            price = prices[i]
-            # Generate OHLC data
-            high = price * np.random.uniform(1.0, 1.01)
-            low = price * np.random.uniform(0.99, 1.0)
-            open_price = np.random.uniform(low, high)
-            close_price = price
-            volume = np.random.randint(100, 10000)
-
-            data.append(
-                {
-                    "ticker": ticker,
-                    "datetime": dt,
-                    "open": np.float32(open_price),
-                    "high": np.float32(high),
-                    "low": np.float32(low),
-                    "close": np.float32(close_price),
-                    "volume": np.int32(volume),
-                }
-            )
-
-    return pd.DataFrame(data)
+    n_rows = len(tickers) * periods
+
+    datetimes = pd.date_range(start_datetime, periods=periods, freq=freq).values
+    datetime_col = np.tile(datetimes, len(tickers))
+    ticker_col = np.repeat(np.array(tickers, dtype=object), periods)
+
+    # Random walk with smaller volatility for minute data
+    base_prices = np.random.uniform(100, 300, size=len(tickers))
+    changes = np.random.normal(0.0001, 0.005, size=(len(tickers), periods))
+    close = (base_prices[:, None] * np.cumprod(1 + changes, axis=1)).ravel()
+
+    high = close * np.random.uniform(1.0, 1.01, size=n_rows)
+    low = close * np.random.uniform(0.99, 1.0, size=n_rows)
+    open_price = np.random.uniform(low, high)
+    volume = np.random.randint(100, 10000, size=n_rows)
+
+    return pd.DataFrame(
+        {
+            "ticker": ticker_col,
+            "datetime": datetime_col,
+            "open": open_price.astype(np.float32),
+            "high": high.astype(np.float32),
+            "low": low.astype(np.float32),
+            "close": close.astype(np.float32),
+            "volume": volume.astype(np.int32),
+        }
+    )
 
 
 # Pre-defined sample datasets for common test scenarios
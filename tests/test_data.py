@@ -122,25 +122,25 @@ class TestApplyIndicators:
     def test_apply_indicators_no_indicators(self, mock_config, sample_stock_data):
         """Test behavior when no indicators are configured."""
         mock_config.indicators = None
-        
+
         test_data = sample_stock_data.head(3).copy()
-        
+
         result = apply_indicators(test_data)
-        
-        # Should return the same dataframe
-        pd.testing.assert_frame_equal(result, test_data)
+
+        # Should return the same dataframe object (no copy made)
+        assert result is test_data
 
     @patch('src.data.config')
     def test_apply_indicators_empty_list(self, mock_config, sample_stock_data):
         """Test behavior with empty indicators list."""
         mock_config.indicators = []
-        
+
         test_data = sample_stock_data.head(3).copy()
-        
+
         result = apply_indicators(test_data)
-        
-        # Should return the same dataframe
-        pd.testing.assert_frame_equal(result, test_data)
+
+        # Should return the same dataframe object (no copy made)
+        assert result is test_data
 
     @patch('src.data.config')
     def test_apply_indicators_multiple_tickers(self, mock_config):
@@ -184,7 +184,7 @@ class TestApplyIndicators:
         
         # Should not add any SMA column
         assert 'SMA_' not in str(result.columns)
-        pd.testing.assert_frame_equal(result, data)
+        assert result is data
 
 
 class TestLoadMinData:
@@ -192,7 +192,7 @@ class TestLoadMinData:
 
     def test_load_min_data_success(self, temp_min_feather_file):
         """Test successful loading and validation of minute data."""
-        result = load_min_data(temp_min_feather_file)
+        result = load_min_data(temp_min_feather_file, needs_date=True)
         
         assert isinstance(result, pd.DataFrame)
         assert len(result) > 0
@@ -213,7 +213,7 @@ class TestLoadMinData:
 
     def test_load_min_data_datetime_conversion(self, temp_min_feather_file_with_tz):
         """Test that timezone-aware datetime is converted to timezone-naive."""
-        result = load_min_data(temp_min_feather_file_with_tz)
+        result = load_min_data(temp_min_feather_file_with_tz, needs_date=True)
         
         # Check that datetime column is timezone-naive after conversion
         assert result['datetime'].dt.tz is None
@@ -222,14 +222,21 @@ class TestLoadMinData:
 
     def test_load_min_data_column_renaming(self, temp_min_feather_file):
         """Test that columns are renamed correctly."""
-        result = load_min_data(temp_min_feather_file)
-        
+        result = load_min_data(temp_min_feather_file, needs_date=True)
+
         # Original 'datetime' should be renamed to 'datetime' (after tz conversion)
         # Original 'date' should be renamed to '_date'
         assert 'datetime' in result.columns
         assert '_date' in result.columns
         assert 'date' not in result.columns  # Original 'date' should be renamed
 
+    def test_load_min_data_skips_date_by_default(self, temp_min_feather_file):
+        """Test that the '_date' column is not built unless requested."""
+        result = load_min_data(temp_min_feather_file)
+
+        assert '_date' not in result.columns
+        assert 'datetime' in result.columns
+
     def test_load_min_data_sorting(self, temp_min_feather_file_unsorted_min):
         """Test that data is sorted by ticker and datetime."""
         result = load_min_data(temp_min_feather_file_unsorted_min)
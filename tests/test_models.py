@@ -1,10 +1,17 @@
 import pytest
 import pandas as pd
-import numpy as np
 from datetime import datetime
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 
-from src.models import ChartsData, ChartsDailyData, ChartsMinuteData, ChartsWMOverride
+from src.models import ChartMeta, ChartsData, ChartsDailyData, ChartsMinuteData, ChartsWMOverride
+
+# Dates shared across this module; datetime objects are immutable so
+# building them once at import is safe.
+_D_JAN01 = datetime(2023, 1, 1)
+_D_JAN02 = datetime(2023, 1, 2)
+_D_JAN10 = datetime(2023, 1, 10)
+_D_JAN15 = datetime(2023, 1, 15)
+_D_JAN16 = datetime(2023, 1, 16)
 
 
 class TestChartsData:
@@ -13,8 +20,11 @@ class TestChartsData:
     def test_init(self, sample_charts_data):
         """Test ChartsData initialization."""
         charts_data = ChartsData(sample_charts_data)
-        
-        assert len(charts_data.charts) == len(sample_charts_data)
+
+        # The constructor stores the object it was given without copying,
+        # so an O(1) identity check is sufficient (and never triggers
+        # pandas' elementwise == overload).
+        assert charts_data.charts is sample_charts_data
         assert charts_data.current_index == 0
 
     def test_set_index(self):
@@ -25,58 +35,25 @@ class TestChartsData:
         charts_data.set_index(2)
         assert charts_data.current_index == 2
 
-    def test_increase_index_normal(self):
-        """Test increasing index within bounds."""
-        charts = ['chart1', 'chart2', 'chart3']
-        charts_data = ChartsData(charts)
-        
-        # Start at 0, should go to 1
-        result = charts_data.increase_index()
-        assert result == 1
-        assert charts_data.current_index == 1
-        
-        # Go to 2
-        result = charts_data.increase_index()
-        assert result == 2
-        assert charts_data.current_index == 2
-
-    def test_increase_index_wrap_around(self):
-        """Test increasing index wraps around at the end."""
+    @pytest.mark.parametrize("start,op,expected", [
+        (0, "inc", 1),
+        (1, "inc", 2),
+        (2, "inc", 0),  # wraps around at the end
+        (2, "dec", 1),
+        (1, "dec", 0),
+        (0, "dec", 2),  # wraps around at the beginning
+    ])
+    def test_index_movement(self, start, op, expected):
+        """Test index stepping in both directions, including wrap-around."""
         charts = ['chart1', 'chart2', 'chart3']
         charts_data = ChartsData(charts)
-        charts_data.set_index(2)  # Set to last index
-        
-        # Should wrap around to 0
-        result = charts_data.increase_index()
-        assert result == 0
-        assert charts_data.current_index == 0
+        charts_data.set_index(start)
 
-    def test_decrease_index_normal(self):
-        """Test decreasing index within bounds."""
-        charts = ['chart1', 'chart2', 'chart3']
-        charts_data = ChartsData(charts)
-        charts_data.set_index(2)  # Start at 2
-        
-        # Should go to 1
-        result = charts_data.decrease_index()
-        assert result == 1
-        assert charts_data.current_index == 1
-        
-        # Go to 0
-        result = charts_data.decrease_index()
-        assert result == 0
-        assert charts_data.current_index == 0
+        step = charts_data.increase_index if op == "inc" else charts_data.decrease_index
+        result = step()
 
-    def test_decrease_index_wrap_around(self):
-        """Test decreasing index wraps around at the beginning."""
-        charts = ['chart1', 'chart2', 'chart3']
-        charts_data = ChartsData(charts)
-        # Start at 0 (default)
-        
-        # Should wrap around to last index (2)
-        result = charts_data.decrease_index()
-        assert result == 2
-        assert charts_data.current_index == 2
+        assert result == expected
+        assert charts_data.current_index == expected
 
     def test_next_chart(self):
         """Test next_chart method calls increase_index and load_chart."""
@@ -135,16 +112,20 @@ class TestChartsDailyData:
         # Mock the load functions
         mock_charts_df = pd.DataFrame({
             'ticker': ['AAPL', 'MSFT'],
-            'date': [datetime(2023, 1, 2), datetime(2023, 1, 1)]
+            'date': [_D_JAN02, _D_JAN01]
         })
         mock_data_df = pd.DataFrame({
             'ticker': ['AAPL'],
-            'date': [datetime(2023, 1, 1)],
+            'date': [_D_JAN01],
             'close': [100.0]
         })
         
-        mock_load_daily_df.side_effect = [mock_charts_df, mock_data_df]
-        
+        # Dispatch on the requested filename instead of a consumable
+        # side_effect list iterator.
+        mock_load_daily_df.side_effect = (
+            lambda fn: mock_charts_df if fn == "dict_file.feather" else mock_data_df
+        )
+
         with patch('src.models.apply_indicators', return_value=mock_data_df) as mock_apply:
             charts_data = ChartsDailyData("dict_file.feather", "data_file.feather")
         
@@ -164,36 +145,32 @@ class TestChartsDailyData:
 
     def test_get_metadata(self):
         """Test get_metadata method."""
-        # Create a mock ChartsDailyData with sample data
-        charts_data = ChartsDailyData.__new__(ChartsDailyData)
-        charts_data.charts = pd.DataFrame({
+        # Create a ChartsDailyData without touching the loaders
+        charts_data = ChartsDailyData._from_parts(pd.DataFrame({
             'ticker': ['AAPL', 'MSFT'],
-            'date': [datetime(2023, 1, 15), datetime(2023, 1, 10)]
-        })
+            'date': [_D_JAN15, _D_JAN10]
+        }))
         
         metadata = charts_data.get_metadata(0)
         
-        expected = {
-            "ticker": "AAPL",
-            "date_str": "2023-01-15",
-            "date": datetime(2023, 1, 15),
-            "timeframe": "1D",
-            "index": 0,
-        }
+        expected = ChartMeta(
+            ticker="AAPL",
+            date_str="2023-01-15",
+            date=_D_JAN15,
+            timeframe="1D",
+            index=0,
+        )
         
         assert metadata == expected
 
     @patch('src.models.load_daily_data')
     def test_load_chart_with_index(self, mock_load_daily_data):
         """Test load_chart method with specific index."""
-        # Create a mock ChartsDailyData
-        charts_data = ChartsDailyData.__new__(ChartsDailyData)
-        charts_data.charts = pd.DataFrame({
+        # Create a ChartsDailyData without touching the loaders
+        charts_data = ChartsDailyData._from_parts(pd.DataFrame({
             'ticker': ['AAPL', 'MSFT'],
-            'date': [datetime(2023, 1, 15), datetime(2023, 1, 10)]
-        })
-        charts_data.data = pd.DataFrame()
-        charts_data.current_index = 0
+            'date': [_D_JAN15, _D_JAN10]
+        }), pd.DataFrame(), 0)
         
         # Mock the load_daily_data function
         mock_df = pd.DataFrame({'close': [100, 101, 102]})
@@ -203,25 +180,22 @@ class TestChartsDailyData:
         
         # Check that load_daily_data was called with correct parameters
         mock_load_daily_data.assert_called_once_with(
-            'MSFT', datetime(2023, 1, 10), charts_data.data
+            'MSFT', _D_JAN10, charts_data.data
         )
         
         # Check return values
         assert df is mock_df
-        assert metadata['ticker'] == 'MSFT'
-        assert metadata['date'] == datetime(2023, 1, 10)
+        assert metadata.ticker == 'MSFT'
+        assert metadata.date == _D_JAN10
 
     @patch('src.models.load_daily_data')
     def test_load_chart_default_index(self, mock_load_daily_data):
         """Test load_chart method with default (current) index."""
-        # Create a mock ChartsDailyData
-        charts_data = ChartsDailyData.__new__(ChartsDailyData)
-        charts_data.charts = pd.DataFrame({
+        # Create a ChartsDailyData without touching the loaders
+        charts_data = ChartsDailyData._from_parts(pd.DataFrame({
             'ticker': ['AAPL', 'MSFT'],
-            'date': [datetime(2023, 1, 15), datetime(2023, 1, 10)]
-        })
-        charts_data.data = pd.DataFrame()
-        charts_data.current_index = 1
+            'date': [_D_JAN15, _D_JAN10]
+        }), pd.DataFrame(), 1)
         
         # Mock the load_daily_data function
         mock_df = pd.DataFrame({'close': [100, 101, 102]})
@@ -231,25 +205,14 @@ class TestChartsDailyData:
         
         # Should use current_index (1)
         mock_load_daily_data.assert_called_once_with(
-            'MSFT', datetime(2023, 1, 10), charts_data.data
+            'MSFT', _D_JAN10, charts_data.data
         )
         
-        assert metadata['ticker'] == 'MSFT'
-
+        assert metadata.ticker == 'MSFT'
 
-class TestChartsWMOverride:
-    """Test cases for the ChartsWMOverride class."""
 
-    def test_watermark_default_parameters(self):
-        """Test watermark method with default parameters."""
-        chart = ChartsWMOverride()
-        chart.id = "test_chart"
-        chart.run_script = Mock()
-        
-        chart.watermark("Test Watermark")
-        
-        # Check that run_script was called with correct parameters
-        expected_script = """
+# Expected run_script payloads for the watermark tests, built once at import.
+_WM_DEFAULT_SCRIPT = """
           test_chart.chart.applyOptions({
               watermark: {
                   visible: true,
@@ -260,24 +223,8 @@ class TestChartsWMOverride:
                   text: 'Test Watermark',
               }
           })"""
-        
-        chart.run_script.assert_called_once_with(expected_script)
 
-    def test_watermark_custom_parameters(self):
-        """Test watermark method with custom parameters."""
-        chart = ChartsWMOverride()
-        chart.id = "test_chart"
-        chart.run_script = Mock()
-        
-        chart.watermark(
-            text="Custom Text",
-            font_size=20,
-            color="red",
-            horz_align="left",
-            vert_align="bottom"
-        )
-        
-        expected_script = """
+_WM_CUSTOM_SCRIPT = """
           test_chart.chart.applyOptions({
               watermark: {
                   visible: true,
@@ -288,19 +235,8 @@ class TestChartsWMOverride:
                   text: 'Custom Text',
               }
           })"""
-        
-        chart.run_script.assert_called_once_with(expected_script)
 
-    def test_watermark_special_characters(self):
-        """Test watermark method with special characters in text."""
-        chart = ChartsWMOverride()
-        chart.id = "test_chart"
-        chart.run_script = Mock()
-        
-        chart.watermark("AAPL 1D 2023-01-15")
-        
-        # Should handle the text as-is
-        expected_script = """
+_WM_SPECIAL_SCRIPT = """
           test_chart.chart.applyOptions({
               watermark: {
                   visible: true,
@@ -311,195 +247,160 @@ class TestChartsWMOverride:
                   text: 'AAPL 1D 2023-01-15',
               }
           })"""
-        
-        chart.run_script.assert_called_once_with(expected_script)
+
+
+class TestChartsWMOverride:
+    """Test cases for the ChartsWMOverride class."""
+
+    def test_watermark_default_parameters(self):
+        """Test watermark method with default parameters."""
+        chart = ChartsWMOverride()
+        chart.id = "test_chart"
+        chart.run_script = Mock()
+
+        chart.watermark("Test Watermark")
+
+        # Check that run_script was called with correct parameters
+        chart.run_script.assert_called_once_with(_WM_DEFAULT_SCRIPT)
+
+    def test_watermark_custom_parameters(self):
+        """Test watermark method with custom parameters."""
+        chart = ChartsWMOverride()
+        chart.id = "test_chart"
+        chart.run_script = Mock()
+
+        chart.watermark(
+            text="Custom Text",
+            font_size=20,
+            color="red",
+            horz_align="left",
+            vert_align="bottom"
+        )
+
+        chart.run_script.assert_called_once_with(_WM_CUSTOM_SCRIPT)
+
+    def test_watermark_special_characters(self):
+        """Test watermark method with special characters in text."""
+        chart = ChartsWMOverride()
+        chart.id = "test_chart"
+        chart.run_script = Mock()
+
+        chart.watermark("AAPL 1D 2023-01-15")
+
+        # Should handle the text as-is
+        chart.run_script.assert_called_once_with(_WM_SPECIAL_SCRIPT)
 
 
 class TestChartsMinuteData:
     """Test cases for the ChartsMinuteData class."""
 
-    @patch('src.models.load_daily_df')
-    @patch('src.models.apply_indicators')
-    def test_init(self, mock_apply_indicators, mock_load_daily_df):
+    def test_init(self, monkeypatch, minute_charts_df, minute_data_df):
         """Test ChartsMinuteData initialization."""
-        # Mock the data loading
-        mock_charts_df = pd.DataFrame({
-            'ticker': ['AAPL', 'MSFT'],
-            'date': [datetime(2023, 1, 15), datetime(2023, 1, 16)],
-            'volume': [1000, 2000]
-        })
-        mock_data_df = pd.DataFrame({
-            'ticker': ['AAPL', 'MSFT'],
-            'date': [datetime(2023, 1, 15), datetime(2023, 1, 16)],
-            'close': [150.0, 250.0]
-        })
-        
-        mock_load_daily_df.side_effect = [mock_charts_df, mock_data_df]
-        mock_apply_indicators.return_value = mock_data_df
-        
+        mock_load_daily_df = Mock(return_value=minute_charts_df)
+        mock_load_min_data = Mock(return_value=minute_data_df)
+        monkeypatch.setattr('src.models.load_daily_df', mock_load_daily_df)
+        monkeypatch.setattr('src.models.load_min_data', mock_load_min_data)
+
         charts_data = ChartsMinuteData("dict.feather", "data.feather")
-        
+
         # Verify initialization
         assert charts_data.current_index == 0
-        assert charts_data.current_timeframe == "1M"
+        assert charts_data.current_timeframe == "1m"
         assert charts_data.dict_filename == "dict.feather"
         assert charts_data.data_filename == "data.feather"
-        
+
         # Verify data loading was called
-        assert mock_load_daily_df.call_count == 2
-        mock_apply_indicators.assert_called_once_with(mock_data_df)
+        mock_load_daily_df.assert_called_once_with("dict.feather")
+        mock_load_min_data.assert_called_once_with("data.feather")
 
-    @patch('src.models.load_daily_df')
-    @patch('src.models.apply_indicators')
-    def test_set_timeframe(self, mock_apply_indicators, mock_load_daily_df):
+    def test_set_timeframe(self, monkeypatch, minute_charts_df, minute_data_df):
         """Test setting timeframe."""
-        # Mock the data loading
-        mock_charts_df = pd.DataFrame({
-            'ticker': ['AAPL'],
-            'date': [datetime(2023, 1, 15)],
-            'volume': [1000]
-        })
-        mock_data_df = pd.DataFrame({
-            'ticker': ['AAPL'],
-            'date': [datetime(2023, 1, 15)],
-            'close': [150.0]
-        })
-        
-        mock_load_daily_df.side_effect = [mock_charts_df, mock_data_df]
-        mock_apply_indicators.return_value = mock_data_df
-        
+        mock_load_daily_df = Mock(return_value=minute_charts_df)
+        mock_load_min_data = Mock(return_value=minute_data_df)
+        monkeypatch.setattr('src.models.load_daily_df', mock_load_daily_df)
+        monkeypatch.setattr('src.models.load_min_data', mock_load_min_data)
+
         charts_data = ChartsMinuteData("dict.feather", "data.feather")
-        
+
         # Test setting timeframe
         charts_data.set_timeframe("5M")
         assert charts_data.current_timeframe == "5M"
-        
+
         charts_data.set_timeframe("1H")
         assert charts_data.current_timeframe == "1H"
 
-    @patch('src.models.load_daily_df')
-    @patch('src.models.apply_indicators')
-    def test_get_metadata(self, mock_apply_indicators, mock_load_daily_df):
+    def test_get_metadata(self, monkeypatch, minute_charts_df, minute_data_df):
         """Test getting metadata with current timeframe."""
-        # Mock the data loading
-        mock_charts_df = pd.DataFrame({
-            'ticker': ['AAPL', 'MSFT'],
-            'date': [datetime(2023, 1, 15), datetime(2023, 1, 16)],
-            'volume': [1000, 2000]
-        })
-        mock_data_df = pd.DataFrame({
-            'ticker': ['AAPL', 'MSFT'],
-            'date': [datetime(2023, 1, 15), datetime(2023, 1, 16)],
-            'close': [150.0, 250.0]
-        })
-        
-        mock_load_daily_df.side_effect = [mock_charts_df, mock_data_df]
-        mock_apply_indicators.return_value = mock_data_df
-        
+        mock_load_daily_df = Mock(return_value=minute_charts_df)
+        mock_load_min_data = Mock(return_value=minute_data_df)
+        monkeypatch.setattr('src.models.load_daily_df', mock_load_daily_df)
+        monkeypatch.setattr('src.models.load_min_data', mock_load_min_data)
+
         charts_data = ChartsMinuteData("dict.feather", "data.feather")
-        
+
         # Test with default timeframe (data is sorted by date descending, so index 0 is the latest date)
         metadata = charts_data.get_metadata(0)
-        expected_metadata = {
-            'ticker': 'MSFT',
-            'date_str': '2023-01-16',
-            'date': datetime(2023, 1, 16),
-            'timeframe': '1M',
-            'index': 0
-        }
+        expected_metadata = ChartMeta(
+            ticker='MSFT', date_str='2023-01-16', date=_D_JAN16,
+            timeframe='1m', index=0
+        )
         assert metadata == expected_metadata
-        
+
         # Test with changed timeframe
         charts_data.set_timeframe("15M")
         metadata = charts_data.get_metadata(1)
-        expected_metadata = {
-            'ticker': 'AAPL',
-            'date_str': '2023-01-15',
-            'date': datetime(2023, 1, 15),
-            'timeframe': '15M',
-            'index': 1
-        }
+        expected_metadata = ChartMeta(
+            ticker='AAPL', date_str='2023-01-15', date=_D_JAN15,
+            timeframe='15M', index=1
+        )
         assert metadata == expected_metadata
 
-    @patch('src.models.load_daily_data')
-    @patch('src.models.load_daily_df')
-    @patch('src.models.apply_indicators')
-    def test_load_chart(self, mock_apply_indicators, mock_load_daily_df, mock_load_daily_data):
+    def test_load_chart(self, monkeypatch, minute_charts_df, minute_data_df,
+                              minute_chart_df):
         """Test loading chart data."""
-        # Mock the data loading
-        mock_charts_df = pd.DataFrame({
-            'ticker': ['AAPL'],
-            'date': [datetime(2023, 1, 15)],
-            'volume': [1000]
-        })
-        mock_data_df = pd.DataFrame({
-            'ticker': ['AAPL'],
-            'date': [datetime(2023, 1, 15)],
-            'close': [150.0]
-        })
-        mock_chart_df = pd.DataFrame({
-            'date': [datetime(2023, 1, 15)],
-            'close': [150.0]
-        })
-        
-        mock_load_daily_df.side_effect = [mock_charts_df, mock_data_df]
-        mock_apply_indicators.return_value = mock_data_df
-        mock_load_daily_data.return_value = mock_chart_df
-        
+        mock_load_daily_df = Mock(return_value=minute_charts_df)
+        mock_load_min_data = Mock(return_value=minute_data_df)
+        mock_load_min_chart = Mock(return_value=minute_chart_df)
+        monkeypatch.setattr('src.models.load_daily_df', mock_load_daily_df)
+        monkeypatch.setattr('src.models.load_min_data', mock_load_min_data)
+        monkeypatch.setattr('src.models.load_min_chart', mock_load_min_chart)
+
         charts_data = ChartsMinuteData("dict.feather", "data.feather")
         charts_data.set_timeframe("5M")
-        
-        # Test loading chart
+
+        # Test loading chart (index 0 is MSFT after descending date sort)
         df, metadata = charts_data.load_chart(0)
-        
-        # Verify load_daily_data was called with correct parameters
-        mock_load_daily_data.assert_called_once_with('AAPL', datetime(2023, 1, 15), mock_data_df)
-        
-        # Verify returned data
-        pd.testing.assert_frame_equal(df, mock_chart_df)
-        expected_metadata = {
-            'ticker': 'AAPL',
-            'date_str': '2023-01-15',
-            'date': datetime(2023, 1, 15),
-            'timeframe': '5M',
-            'index': 0
-        }
+
+        # Verify load_min_chart was called with correct parameters
+        mock_load_min_chart.assert_called_once_with('MSFT', _D_JAN16, minute_data_df)
+
+        # load_chart passes the frame through untouched
+        assert df is minute_chart_df
+        expected_metadata = ChartMeta(
+            ticker='MSFT', date_str='2023-01-16', date=_D_JAN16,
+            timeframe='5M', index=0
+        )
         assert metadata == expected_metadata
 
-    @patch('src.models.load_daily_data')
-    @patch('src.models.load_daily_df')
-    @patch('src.models.apply_indicators')
-    def test_load_chart_default_index(self, mock_apply_indicators, mock_load_daily_df, mock_load_daily_data):
+    def test_load_chart_default_index(self, monkeypatch, minute_charts_df, minute_data_df,
+                                            minute_chart_df):
         """Test loading chart data with default index."""
-        # Mock the data loading
-        mock_charts_df = pd.DataFrame({
-            'ticker': ['AAPL', 'MSFT'],
-            'date': [datetime(2023, 1, 15), datetime(2023, 1, 16)],
-            'volume': [1000, 2000]
-        })
-        mock_data_df = pd.DataFrame({
-            'ticker': ['AAPL', 'MSFT'],
-            'date': [datetime(2023, 1, 15), datetime(2023, 1, 16)],
-            'close': [150.0, 250.0]
-        })
-        mock_chart_df = pd.DataFrame({
-            'date': [datetime(2023, 1, 16)],
-            'close': [250.0]
-        })
-        
-        mock_load_daily_df.side_effect = [mock_charts_df, mock_data_df]
-        mock_apply_indicators.return_value = mock_data_df
-        mock_load_daily_data.return_value = mock_chart_df
-        
+        mock_load_daily_df = Mock(return_value=minute_charts_df)
+        mock_load_min_data = Mock(return_value=minute_data_df)
+        mock_load_min_chart = Mock(return_value=minute_chart_df)
+        monkeypatch.setattr('src.models.load_daily_df', mock_load_daily_df)
+        monkeypatch.setattr('src.models.load_min_data', mock_load_min_data)
+        monkeypatch.setattr('src.models.load_min_chart', mock_load_min_chart)
+
         charts_data = ChartsMinuteData("dict.feather", "data.feather")
         charts_data.current_index = 1  # Set to second chart
-        
+
         # Test loading chart without specifying index (should use current_index)
         df, metadata = charts_data.load_chart()
-        
-        # Verify load_daily_data was called with current index data (index 1 is AAPL after sorting)
-        mock_load_daily_data.assert_called_once_with('AAPL', datetime(2023, 1, 15), mock_data_df)
-        
+
+        # Verify load_min_chart was called with current index data (index 1 is AAPL after sorting)
+        mock_load_min_chart.assert_called_once_with('AAPL', _D_JAN15, minute_data_df)
+
         # Verify returned metadata uses current index
-        assert metadata['ticker'] == 'AAPL'
-        assert metadata['index'] == 1
\ No newline at end of file
+        assert metadata.ticker == 'AAPL'
+        assert metadata.index == 1
\ No newline at end of file
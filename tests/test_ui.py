@@ -1,8 +1,11 @@
 import pytest
 import pandas as pd
+from contextlib import ExitStack
 from datetime import datetime
-from unittest.mock import Mock, patch, MagicMock, mock_open
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
 
+from src import ui as ui_module
 from src.ui import (
     plot_chart,
     plot_line,
@@ -18,29 +21,119 @@ from src.ui import (
     save_screenshot,
     create_and_bind_chart,
 )
-from src.models import ChartsMinuteData
+from src.models import ChartMeta, ChartsDailyData, ChartsMinuteData
+
+# The chart methods the ui module actually calls; keeps chart mocks
+# bounded instead of lazily spawning a child mock per attribute access.
+CHART_SPEC = [
+    "set",
+    "watermark",
+    "legend",
+    "price_line",
+    "create_line",
+    "screenshot",
+    "hotkey",
+    "resize",
+    "create_subchart",
+    "topbar",
+    "run_script",
+    "show",
+]
+
+# Failure sequences for plot_chart's watermark fallback chain.
+_WATERMARK_ATTR_ERROR = (AttributeError("Custom watermark not available"),)
+_WATERMARK_ALL_FAIL = (
+    TypeError("Custom watermark not available"),
+    Exception("Standard watermark failed"),
+)
 
 
-class TestPlotChart:
-    """Test cases for the plot_chart function."""
+def _watermark_failures(*errors):
+    """side_effect callable raising each error in turn, then succeeding."""
+    remaining = list(errors)
+
+    def side_effect(*args, **kwargs):
+        if remaining:
+            raise remaining.pop(0)
+
+    return side_effect
+
+
+@pytest.fixture(scope="module")
+def sample_df():
+    """Module-scoped price frame; tests only read it, so sharing is safe."""
+    return pd.DataFrame(
+        {"date": pd.date_range("2023-01-01", periods=3), "close": [100, 101, 102]}
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_metadata():
+    """Module-scoped metadata; ChartMeta is immutable."""
+    return ChartMeta(ticker="AAPL", date_str="2023-01-15", timeframe="1D")
 
-    def test_plot_chart_success(self):
-        """Test successful chart plotting."""
-        # Create mock chart and data
-        mock_chart = Mock()
-        mock_chart.watermark = Mock()
-        mock_chart.legend = Mock()
 
-        df = pd.DataFrame(
-            {"date": pd.date_range("2023-01-01", periods=3), "close": [100, 101, 102]}
+@pytest.fixture(scope="module")
+def sample_df_with_sma(sample_df):
+    """sample_df with an SMA_20 column; assign copies the base frame."""
+    return sample_df.assign(SMA_20=[99, 100, 101])
+
+
+@pytest.fixture(scope="module")
+def expected_sma_slice(sample_df_with_sma):
+    """The slice plot_indicators is expected to hand to plot_line."""
+    return sample_df_with_sma[["date", "SMA_20"]]
+
+
+@pytest.fixture
+def ui_patches():
+    """Patches Chart and the plotting helpers in one stack."""
+    with ExitStack() as stack:
+        yield SimpleNamespace(
+            Chart=stack.enter_context(patch.object(ui_module, "Chart")),
+            plot_chart=stack.enter_context(patch.object(ui_module, "plot_chart")),
+            plot_indicators=stack.enter_context(
+                patch.object(ui_module, "plot_indicators")
+            ),
+        )
+
+
+@pytest.fixture(scope="class")
+def dual_patches():
+    """Patches for the dual-grid tests, entered once per class."""
+    with ExitStack() as stack:
+        yield SimpleNamespace(
+            Chart=stack.enter_context(patch.object(ui_module, "Chart")),
+            plot_chart=stack.enter_context(patch.object(ui_module, "plot_chart")),
+            plot_indicators=stack.enter_context(
+                patch.object(ui_module, "plot_indicators")
+            ),
+            ChartsMinuteData=stack.enter_context(
+                patch.object(ui_module, "ChartsMinuteData")
+            ),
         )
 
-        metadata = {"ticker": "AAPL", "timeframe": "1D", "date_str": "2023-01-15"}
 
-        plot_chart(df, metadata, mock_chart)
+class TestPlotChart:
+    """Test cases for the plot_chart function."""
+
+    @pytest.fixture(scope="class")
+    def _chart_template(self):
+        """One chart mock shared by the whole class."""
+        return Mock(spec=CHART_SPEC)
+
+    @pytest.fixture
+    def mock_chart(self, _chart_template):
+        """The shared chart mock, wiped of calls and side effects."""
+        _chart_template.reset_mock(return_value=True, side_effect=True)
+        return _chart_template
+
+    def test_plot_chart_success(self, mock_chart, sample_df, sample_metadata):
+        """Test successful chart plotting."""
+        plot_chart(sample_df, sample_metadata, mock_chart)
 
         # Verify chart methods were called
-        mock_chart.set.assert_called_once_with(df)
+        mock_chart.set.assert_called_once_with(sample_df)
         mock_chart.watermark.assert_called_once_with(
             "AAPL 1D 2023-01-15", vert_align="top"
         )
@@ -53,27 +146,31 @@ class TestPlotChart:
             percent=False,
         )
 
-    def test_plot_chart_watermark_attribute_error(self):
+    def test_plot_chart_watermark_attribute_error(
+        self, mock_chart, sample_df, sample_metadata
+    ):
         """Test chart plotting when watermark raises AttributeError."""
-        # Create mock chart that raises AttributeError on first call, succeeds on second
-        mock_chart = Mock()
-        mock_chart.watermark = Mock(
-            side_effect=[TypeError("Custom watermark not available"), None]
-        )
-        mock_chart.watermark = Mock(
-            side_effect=[AttributeError("Custom watermark not available"), None]
-        )
-        mock_chart.legend = Mock()
-
-        df = pd.DataFrame({"close": [100, 101, 102]})
-        metadata = {"ticker": "AAPL", "timeframe": "1D", "date_str": "2023-01-15"}
+        # Watermark fails on the first call, succeeds on the second
+        mock_chart.watermark.side_effect = _watermark_failures(*_WATERMARK_ATTR_ERROR)
 
-        plot_chart(df, metadata, mock_chart)
+        plot_chart(sample_df, sample_metadata, mock_chart)
 
-        # Should call watermark twice: once with full text (fails), once with "na"
+        # Should call watermark twice: with vert_align (fails), then without
         assert mock_chart.watermark.call_count == 2
         mock_chart.watermark.assert_any_call("AAPL 1D 2023-01-15", vert_align="top")
-        mock_chart.watermark.assert_any_call("na")
+        mock_chart.watermark.assert_called_with("AAPL 1D 2023-01-15")
+
+    def test_plot_chart_watermark_complete_failure(
+        self, mock_chart, sample_df, sample_metadata
+    ):
+        """Test chart plotting when both watermark variants fail."""
+        mock_chart.watermark.side_effect = _watermark_failures(*_WATERMARK_ALL_FAIL)
+
+        plot_chart(sample_df, sample_metadata, mock_chart)
+
+        # Custom and standard watermark both fail; "na" placeholder is set
+        assert mock_chart.watermark.call_count == 3
+        assert mock_chart.watermark.call_args.args == ("na",)
 
 
 class TestPlotLine:
@@ -81,7 +178,7 @@ class TestPlotLine:
 
     def test_plot_line(self):
         """Test plotting a line on the chart."""
-        mock_chart = Mock()
+        mock_chart = Mock(spec=CHART_SPEC)
         mock_line = Mock()
         mock_chart.create_line.return_value = mock_line
 
@@ -99,199 +196,109 @@ class TestPlotLine:
 class TestNavigationFunctions:
     """Test cases for navigation functions."""
 
-    def test_on_up(self):
+    def test_on_up(self, sample_df, sample_metadata):
         """Test on_up function."""
-        mock_chart = Mock()
-        mock_chart_data = Mock()
+        mock_chart = Mock(spec=CHART_SPEC)
+        mock_chart_data = Mock(spec=ChartsDailyData)
 
         # Mock the next_chart method
-        mock_df = pd.DataFrame({"close": [100, 101, 102]})
-        mock_metadata = {"ticker": "AAPL", "timeframe": "1D", "date_str": "2023-01-15"}
-        mock_chart_data.next_chart.return_value = (mock_df, mock_metadata)
+        mock_chart_data.next_chart.return_value = (sample_df, sample_metadata)
 
-        with patch("src.ui.plot_chart") as mock_plot_chart:
+        with patch.object(ui_module, "plot_chart") as mock_plot_chart:
             on_up(mock_chart, mock_chart_data)
 
         # Verify next_chart was called and plot_chart was called with results
         mock_chart_data.next_chart.assert_called_once()
-        mock_plot_chart.assert_called_once_with(mock_df, mock_metadata, mock_chart)
+        mock_plot_chart.assert_called_once_with(sample_df, sample_metadata, mock_chart)
 
-    def test_on_down(self):
+    def test_on_down(self, sample_df, sample_metadata):
         """Test on_down function."""
-        mock_chart = Mock()
-        mock_chart_data = Mock()
+        mock_chart = Mock(spec=CHART_SPEC)
+        mock_chart_data = Mock(spec=ChartsDailyData)
 
         # Mock the previous_chart method
-        mock_df = pd.DataFrame({"close": [100, 101, 102]})
-        mock_metadata = {"ticker": "MSFT", "timeframe": "1D", "date_str": "2023-01-10"}
-        mock_chart_data.previous_chart.return_value = (mock_df, mock_metadata)
+        mock_chart_data.previous_chart.return_value = (sample_df, sample_metadata)
 
-        with patch("src.ui.plot_chart") as mock_plot_chart:
+        with patch.object(ui_module, "plot_chart") as mock_plot_chart:
             on_down(mock_chart, mock_chart_data)
 
         # Verify previous_chart was called and plot_chart was called with results
         mock_chart_data.previous_chart.assert_called_once()
-        mock_plot_chart.assert_called_once_with(mock_df, mock_metadata, mock_chart)
+        mock_plot_chart.assert_called_once_with(sample_df, sample_metadata, mock_chart)
 
 
 class TestPlotIndicators:
     """Test cases for the plot_indicators function."""
 
-    @patch("src.ui.config")
-    @patch("src.ui.plot_line")
-    def test_plot_indicators_sma(self, mock_plot_line, mock_config):
-        """Test plotting SMA indicator."""
-        # Mock configuration
-        mock_indicator = MagicMock()
-        mock_indicator.name = "SMA"
-        mock_indicator.parameters = {"period": 20}
-        mock_config.indicators = [mock_indicator]
-
-        # Create DataFrame with SMA column
-        df = pd.DataFrame(
-            {
-                "date": pd.date_range("2023-01-01", periods=3),
-                "close": [100, 101, 102],
-                "SMA_20": [99, 100, 101],
-            }
-        )
-
-        mock_chart = Mock()
-
-        plot_indicators(df, mock_chart)
-
-        # Verify plot_line was called for SMA
-        mock_plot_line.assert_called_once()
-        call_args = mock_plot_line.call_args
-        called_data, called_chart, called_name = call_args[0]
-
-        # Check the arguments separately
-        pd.testing.assert_frame_equal(called_data, df[["date", "SMA_20"]])
-        assert called_chart is mock_chart
-        assert called_name == "SMA_20"
-
-    @patch("src.ui.config")
-    @patch("src.ui.plot_line")
-    def test_plot_indicators_sma_missing_column(self, mock_plot_line, mock_config):
-        """Test plotting SMA indicator when column is missing."""
-        # Mock configuration
-        mock_indicator = MagicMock()
-        mock_indicator.name = "SMA"
-        mock_indicator.parameters = {"period": 20}
-        mock_config.indicators = [mock_indicator]
-
-        # Create DataFrame without SMA column
-        df = pd.DataFrame(
-            {"date": pd.date_range("2023-01-01", periods=3), "close": [100, 101, 102]}
-        )
-
-        mock_chart = Mock()
-
-        plot_indicators(df, mock_chart)
-
-        # plot_line should not be called since SMA_20 column doesn't exist
-        mock_plot_line.assert_not_called()
-
-    @patch("src.ui.config")
-    @patch("src.ui.plot_line")
-    def test_plot_indicators_no_parameters(self, mock_plot_line, mock_config):
-        """Test plotting indicator with no parameters."""
-        # Mock configuration
-        mock_indicator = MagicMock()
-        mock_indicator.name = "SMA"
-        mock_indicator.parameters = None
-        mock_config.indicators = [mock_indicator]
-
-        df = pd.DataFrame(
-            {"date": pd.date_range("2023-01-01", periods=3), "close": [100, 101, 102]}
-        )
-
-        mock_chart = Mock()
-
-        plot_indicators(df, mock_chart)
-
-        # plot_line should not be called since no period is specified
-        mock_plot_line.assert_not_called()
-
-    @patch("src.ui.config")
-    @patch("src.ui.plot_line")
-    def test_plot_indicators_no_indicators(self, mock_plot_line, mock_config):
-        """Test plotting when no indicators are configured."""
-        mock_config.indicators = None
-
-        df = pd.DataFrame(
-            {"date": pd.date_range("2023-01-01", periods=3), "close": [100, 101, 102]}
-        )
-
-        mock_chart = Mock()
-
-        plot_indicators(df, mock_chart)
-
-        # plot_line should not be called
-        mock_plot_line.assert_not_called()
-
-    @patch("src.ui.config")
-    @patch("src.ui.plot_line")
-    def test_plot_indicators_empty_list(self, mock_plot_line, mock_config):
-        """Test plotting with empty indicators list."""
-        mock_config.indicators = []
-
-        df = pd.DataFrame(
-            {"date": pd.date_range("2023-01-01", periods=3), "close": [100, 101, 102]}
-        )
-
-        mock_chart = Mock()
-
-        plot_indicators(df, mock_chart)
+    @pytest.mark.parametrize(
+        "name,params,has_col,expected_calls",
+        [
+            ("SMA", {"period": 20}, True, 1),
+            ("SMA", {"period": 20}, False, 0),  # SMA_20 column missing
+            ("SMA", None, False, 0),  # no period specified
+            (None, None, False, 0),  # no indicators configured
+            ("empty", None, False, 0),  # empty indicators list
+            ("RSI", {"period": 14}, False, 0),  # only SMA is implemented
+        ],
+        ids=[
+            "sma",
+            "sma_missing_column",
+            "no_parameters",
+            "no_indicators",
+            "empty_list",
+            "non_sma",
+        ],
+    )
+    @patch.object(ui_module, "config")
+    @patch.object(ui_module, "plot_line")
+    def test_plot_indicators(
+        self, mock_plot_line, mock_config, name, params, has_col, expected_calls,
+        sample_df, sample_df_with_sma, expected_sma_slice
+    ):
+        """plot_line fires once per configured SMA whose column exists."""
+        if name is None:
+            mock_config.indicators = None
+        elif name == "empty":
+            mock_config.indicators = []
+        else:
+            # plot_indicators only reads attributes, so a plain namespace
+            # stands in for the pydantic indicator model
+            mock_config.indicators = [SimpleNamespace(name=name, parameters=params)]
 
-        # plot_line should not be called
-        mock_plot_line.assert_not_called()
-
-    @patch("src.ui.config")
-    @patch("src.ui.plot_line")
-    def test_plot_indicators_non_sma(self, mock_plot_line, mock_config):
-        """Test plotting non-SMA indicator (should be ignored)."""
-        # Mock configuration with non-SMA indicator
-        mock_indicator = MagicMock()
-        mock_indicator.name = "RSI"
-        mock_indicator.parameters = {"period": 14}
-        mock_config.indicators = [mock_indicator]
-
-        df = pd.DataFrame(
-            {"date": pd.date_range("2023-01-01", periods=3), "close": [100, 101, 102]}
-        )
+        df = sample_df_with_sma if has_col else sample_df
 
-        mock_chart = Mock()
+        mock_chart = Mock(spec=CHART_SPEC)
 
         plot_indicators(df, mock_chart)
 
-        # plot_line should not be called since only SMA is implemented
-        mock_plot_line.assert_not_called()
+        assert mock_plot_line.call_count == expected_calls
+        if expected_calls:
+            called_data, called_chart, called_name = mock_plot_line.call_args[0]
+            pd.testing.assert_frame_equal(called_data, expected_sma_slice)
+            assert called_chart is mock_chart
+            assert called_name == "SMA_20"
 
 
 class TestSaveScreenshot:
     """Test cases for the save_screenshot function."""
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("os.makedirs")
-    def test_save_screenshot(self, mock_makedirs, mock_file_open):
+    def test_save_screenshot(self, tmp_path):
         """Test save_screenshot function."""
         from src.ui import save_screenshot
 
         # Create mock chart and chart_data
-        mock_chart = Mock()
+        mock_chart = Mock(spec=CHART_SPEC)
         mock_chart.screenshot.return_value = b"fake_image_data"
 
         mock_chart_data = Mock()
         mock_chart_data.current_index = 0
-        mock_chart_data.get_metadata.return_value = {
-            "ticker": "AAPL",
-            "date_str": "2023-01-15",
-        }
+        mock_chart_data.get_metadata.return_value = ChartMeta(
+            ticker="AAPL", date_str="2023-01-15"
+        )
 
-        # Mock print to capture output
+        # Mock print to capture output; the write itself goes to tmp_path
         with patch("builtins.print") as mock_print:
-            save_screenshot(mock_chart, mock_chart_data, "test_folder")
+            save_screenshot(mock_chart, mock_chart_data, str(tmp_path))
 
         # Verify screenshot was taken
         mock_chart.screenshot.assert_called_once()
@@ -300,47 +307,41 @@ class TestSaveScreenshot:
         mock_chart_data.get_metadata.assert_called_once_with(0)
 
         # Verify file was written
-        expected_filename = "test_folder/AAPL_2023-01-15_screenshot.png"
-        mock_file_open.assert_called_once_with(expected_filename, "wb")
-        mock_file_open().write.assert_called_once_with(b"fake_image_data")
+        expected_file = tmp_path / "AAPL_2023-01-15_screenshot.png"
+        assert expected_file.read_bytes() == b"fake_image_data"
 
         # Verify print message
-        mock_print.assert_called_once_with(f"Screenshot saved to {expected_filename}")
+        mock_print.assert_called_once_with(f"Screenshot saved to {expected_file}")
 
 
 class TestCreateAndBindChart:
     """Test cases for the create_and_bind_chart function."""
 
-    @patch("src.ui.Chart")
-    @patch("src.ui.plot_chart")
-    @patch("src.ui.plot_indicators")
-    def test_create_and_bind_chart(
-        self, mock_plot_indicators, mock_plot_chart, mock_chart_class
-    ):
+    def test_create_and_bind_chart(self, ui_patches, sample_df, sample_metadata):
         """Test create_and_bind_chart function."""
         from src.ui import create_and_bind_chart
 
         # Create mock chart instance
-        mock_chart = Mock()
-        mock_chart_class.return_value = mock_chart
+        mock_chart = Mock(spec=CHART_SPEC)
+        ui_patches.Chart.return_value = mock_chart
 
         # Create mock chart_data
-        mock_chart_data = Mock()
-        mock_df = pd.DataFrame({"close": [100, 101, 102]})
-        mock_metadata = {"ticker": "AAPL", "date_str": "2023-01-15"}
-        mock_chart_data.load_chart.return_value = (mock_df, mock_metadata)
+        mock_chart_data = Mock(spec=ChartsDailyData)
+        mock_chart_data.load_chart.return_value = (sample_df, sample_metadata)
 
         result = create_and_bind_chart(mock_chart_data)
 
         # Verify chart was created
-        mock_chart_class.assert_called_once()
+        ui_patches.Chart.assert_called_once()
 
         # Verify data was loaded
         mock_chart_data.load_chart.assert_called_once_with(0)
 
         # Verify plotting functions were called
-        mock_plot_chart.assert_called_once_with(mock_df, mock_metadata, mock_chart)
-        mock_plot_indicators.assert_called_once_with(mock_df, mock_chart)
+        ui_patches.plot_chart.assert_called_once_with(
+            sample_df, sample_metadata, mock_chart
+        )
+        ui_patches.plot_indicators.assert_called_once_with(sample_df, mock_chart)
 
         # Verify hotkeys were bound
         assert mock_chart.hotkey.call_count == 3
@@ -353,3 +354,78 @@ class TestCreateAndBindChart:
 
         # Verify the chart is returned
         assert result is mock_chart
+
+
+class TestCreateDualChartGrid:
+    """Test cases for the create_dual_chart_grid function."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_patches(self, dual_patches):
+        """Resets the class-scoped patches between tests."""
+        yield
+        for mock in vars(dual_patches).values():
+            mock.reset_mock(return_value=True, side_effect=True)
+
+    @pytest.fixture(scope="class")
+    def _grid_chart_templates(self):
+        """Main and right chart mocks with the subchart wiring baked in."""
+        # topbar auto-vivifies on first access, no explicit wiring needed
+        main_chart = MagicMock()
+        right_chart = MagicMock()
+        main_chart.create_subchart.return_value = right_chart
+        return main_chart, right_chart
+
+    @pytest.fixture
+    def grid_charts(self, _grid_chart_templates):
+        """The shared chart pair with call history cleared."""
+        # Plain reset keeps the create_subchart return value wired
+        for chart in _grid_chart_templates:
+            chart.reset_mock()
+        return _grid_chart_templates
+
+    @pytest.mark.parametrize(
+        "data_filename,expected_min",
+        [
+            ("data/default_data.feather", "data/default_min_data.feather"),
+            ("data/default_data", "data/default_data_min_data.feather"),
+        ],
+        ids=["feather", "non_feather"],
+    )
+    def test_create_dual_chart_grid_min_filename(
+        self, dual_patches, grid_charts, sample_df, sample_metadata, data_filename,
+        expected_min
+    ):
+        """The right chart's minute file is derived from the daily filename."""
+        # Main chart plus the subchart it spawns for the right side
+        mock_main_chart, mock_right_chart = grid_charts
+        dual_patches.Chart.return_value = mock_main_chart
+
+        # Daily data for the left chart: a plain attribute bag is enough,
+        # only load_chart needs to be callable
+        mock_chart_data = SimpleNamespace(
+            dict_filename="data/default.feather",
+            data_filename=data_filename,
+            load_chart=Mock(return_value=(sample_df, sample_metadata)),
+        )
+
+        # Minute data instance created inside create_dual_chart_grid
+        mock_minute_data = dual_patches.ChartsMinuteData.return_value
+        mock_minute_data.load_chart.return_value = (sample_df, sample_metadata)
+
+        result = create_dual_chart_grid(mock_chart_data)
+
+        # Verify the minute data was created from the derived filename; a
+        # plain tuple compare skips mock's _Call equality machinery
+        assert dual_patches.ChartsMinuteData.call_count == 1
+        assert dual_patches.ChartsMinuteData.call_args.args == (
+            "data/default.feather",
+            expected_min,
+        )
+
+        # Verify the side-by-side layout and that both charts were plotted
+        dual_patches.Chart.assert_called_once_with(inner_width=0.5, inner_height=1.0)
+        mock_main_chart.create_subchart.assert_called_once_with(
+            position="right", width=0.5, height=1.0
+        )
+        assert dual_patches.plot_chart.call_count == 2
+        assert result is mock_main_chart